@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+from typing import Dict
+
+import requests
+
+from loadgen import Operation, free_port, run_load, start_server, stop_servers, wait_http
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAB6_DIR = os.path.join(ROOT, 'lab-6')
+LAB7_DIR = os.path.join(ROOT, 'lab-7')
+
+# Количество ключей в хранилище lab-7 для нагрузки
+KEY_SPACE = 200
+
+# --- lab-7: key-value API ---
+
+# Запуск app.py из lab-7 без лимитера и debug-перезагрузчика.
+# Рабочая директория - временная, чтобы не трогать data.json в репозитории.
+LAB7_LAUNCHER = """
+import sys
+sys.path.insert(0, sys.argv[1])
+import app as lab7
+lab7.limiter.enabled = False
+lab7.load_data()
+lab7.app.run(host='127.0.0.1', port=int(sys.argv[2]), threaded=True)
+"""
+
+
+def _key(rnd) -> str:
+    return f"bench:{rnd.randrange(KEY_SPACE)}"
+
+
+LAB7_OPERATIONS: Dict[str, Operation] = {
+    'get': lambda s, url, rnd: s.get(f"{url}/get/{_key(rnd)}"),
+    'exists': lambda s, url, rnd: s.get(f"{url}/exists/{_key(rnd)}"),
+    'set': lambda s, url, rnd: s.post(f"{url}/set", json={"key": _key(rnd), "value": rnd.random()}),
+    'scan': lambda s, url, rnd: s.get(f"{url}/scan", params={"prefix": f"bench:{rnd.randrange(10)}", "limit": 50}),
+    'count': lambda s, url, rnd: s.get(f"{url}/count", params={"prefix": "bench:"}),
+}
+LAB7_DEFAULT_MIX = 'get=60,exists=10,set=20,scan=5,count=5'
+
+
+def bench_lab7(mix, total_requests: int, concurrency: int, runs: int = 3, warmup: int = 100) -> Dict:
+    """Нагрузочный прогон API хранилища lab-7."""
+    workdir = tempfile.mkdtemp(prefix='bench_lab7_')
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    proc = start_server(['-c', LAB7_LAUNCHER, LAB7_DIR, str(port)], cwd=workdir)
+    try:
+        wait_http(f"{url}/exists/bench:0")
+        # Предварительно заполняем хранилище, чтобы get/scan попадали в данные
+        with requests.Session() as s:
+            for i in range(KEY_SPACE):
+                s.post(f"{url}/set", json={"key": f"bench:{i}", "value": i})
+        return run_load(url, LAB7_OPERATIONS, mix, total_requests, concurrency, runs, warmup)
+    finally:
+        stop_servers([proc])
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# --- lab-6: балансировщик ---
+
+# Запуск balancer.py на заданном порту (в исходнике порт зафиксирован)
+LAB6_LAUNCHER = """
+import sys
+sys.path.insert(0, sys.argv[1])
+import balancer
+balancer.app.run(host='127.0.0.1', port=int(sys.argv[2]), threaded=True)
+"""
+
+LAB6_OPERATIONS: Dict[str, Operation] = {
+    'process': lambda s, url, rnd: s.get(f"{url}/process"),
+}
+LAB6_DEFAULT_MIX = 'process=1'
+
+
+def bench_lab6(instances: int, mix, total_requests: int, concurrency: int,
+               runs: int = 3, warmup: int = 100) -> Dict:
+    """Нагрузочный прогон балансировщика lab-6 с N локальными инстансами app.py."""
+    procs = []
+    try:
+        ports = [free_port() for _ in range(instances)]
+        for port in ports:
+            procs.append(start_server([os.path.join(LAB6_DIR, 'app.py'), str(port)], cwd=LAB6_DIR))
+        for port in ports:
+            wait_http(f"http://127.0.0.1:{port}/health")
+
+        balancer_port = free_port()
+        url = f"http://127.0.0.1:{balancer_port}"
+        procs.append(start_server(['-c', LAB6_LAUNCHER, LAB6_DIR, str(balancer_port)], cwd=LAB6_DIR))
+        wait_http(url)
+        for port in ports:
+            requests.post(f"{url}/add_instance", data={"ip": "127.0.0.1", "port": port})
+        # Health check балансировщика выполняется раз в 5 секунд
+        wait_http(f"{url}/process", timeout=30)
+
+        result = run_load(url, LAB6_OPERATIONS, mix, total_requests, concurrency, runs, warmup)
+        result["instances"] = instances
+        return result
+    finally:
+        stop_servers(procs)
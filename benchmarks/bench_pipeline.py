@@ -0,0 +1,121 @@
+import asyncio
+import contextlib
+import gc
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAB8_DIR = os.path.join(ROOT, 'lab-8')
+sys.path.insert(0, LAB8_DIR)
+
+import generation  # noqa: E402
+import processor  # noqa: E402
+
+
+@contextlib.contextmanager
+def _in_tempdir():
+    """Выполняет блок во временной директории (модули lab-8 пишут файл в cwd)."""
+    old_cwd = os.getcwd()
+    workdir = tempfile.mkdtemp(prefix='bench_lab8_')
+    os.chdir(workdir)
+    try:
+        yield workdir
+    finally:
+        os.chdir(old_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+async def _no_sleep(delay, result=None):
+    """Замена asyncio.sleep: модули lab-8 имитируют задержки, которые не нужно измерять."""
+    return result
+
+
+def _per_call(func, repeat: int = 20, min_time: float = 0.05) -> float:
+    """
+    Время одного вызова func в секундах.
+    Число вызовов в серии подбирается так, чтобы серия длилась не меньше min_time;
+    результат - лучшая из repeat серий, деленная на число вызовов.
+    Сборщик мусора на время замеров отключается, как в timeit.
+    """
+    def series(number: int) -> float:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - started
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = 1
+        while (best := series(number)) < min_time:
+            number *= 2
+        for _ in range(repeat - 1):
+            best = min(best, series(number))
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best / number
+
+
+def bench_generation(size: int, batch_size: int = 10) -> Dict:
+    """Полный конвейер generation.py: генерация, группировка и запись size транзакций."""
+    async def pipeline():
+        batches = generation.batch_stream(generation.transaction_stream(size), batch_size=batch_size)
+        await generation.save_to_file(batches)
+
+    with _in_tempdir(), contextlib.redirect_stdout(io.StringIO()), \
+            mock.patch('asyncio.sleep', _no_sleep):
+        loop = asyncio.new_event_loop()
+        try:
+            seconds = _per_call(lambda: loop.run_until_complete(pipeline()))
+        finally:
+            loop.close()
+    return {
+        "size": size,
+        "gen_ms": round(seconds * 1000, 3),
+        "gen_items_per_s": round(size / seconds, 2),
+    }
+
+
+def _synthetic_transactions(size: int) -> List[Dict]:
+    """Транзакции в формате generation.py без имитационных задержек."""
+    rnd = random.Random(size)
+    return [
+        {
+            "timestamp": "2025-01-01T00:00:00",
+            "category": rnd.choice(generation.CATEGORIES),
+            "amount": round(rnd.uniform(100.0, 5000.0), 2),
+        }
+        for _ in range(size)
+    ]
+
+
+def bench_processor(size: int) -> Dict:
+    """Загрузка файла и агрегация по категориям в processor.py."""
+    with _in_tempdir(), contextlib.redirect_stdout(io.StringIO()), \
+            mock.patch('asyncio.sleep', _no_sleep):
+        with open(processor.FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(_synthetic_transactions(size), f, ensure_ascii=False)
+
+        # Один цикл событий на все прогоны, чтобы не измерять его создание
+        loop = asyncio.new_event_loop()
+        try:
+            load_s = _per_call(lambda: loop.run_until_complete(processor.load_transactions()))
+            data = loop.run_until_complete(processor.load_transactions())
+            process_s = _per_call(lambda: loop.run_until_complete(processor.process_data(data)))
+        finally:
+            loop.close()
+    return {
+        "size": size,
+        "load_ms": round(load_s * 1000, 3),
+        "process_ms": round(process_s * 1000, 3),
+        "process_items_per_s": round(size / process_s, 2),
+    }
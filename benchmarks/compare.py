@@ -0,0 +1,82 @@
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+
+def direction(metric: str) -> Optional[int]:
+    """
+    Направление метрики: +1 - чем больше, тем лучше (rps, *_per_s),
+    -1 - чем меньше, тем лучше (*_ms, error_rate), None - не сравнивается.
+    max_ms определяется единичным выбросом, поэтому не сравнивается.
+    """
+    if metric == 'max_ms':
+        return None
+    if metric == 'rps' or metric.endswith('_per_s'):
+        return 1
+    if metric.endswith('_ms') or metric == 'error_rate':
+        return -1
+    return None
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> List[Dict]:
+    """
+    Сравнивает метрики двух прогонов.
+    Регрессия - ухудшение метрики более чем на threshold (доля, 0.1 = 10%).
+    """
+    rows = []
+    for name, metrics in current.get('benchmarks', {}).items():
+        base_metrics = baseline.get('benchmarks', {}).get(name)
+        if base_metrics is None:
+            continue
+        for metric, value in metrics.items():
+            sign = direction(metric)
+            base = base_metrics.get(metric)
+            if sign is None or not isinstance(value, (int, float)) or not isinstance(base, (int, float)):
+                continue
+            if base:
+                change = (value - base) / base
+            else:
+                change = 0.0 if value == base else float('inf')
+            rows.append({
+                "benchmark": name,
+                "metric": metric,
+                "baseline": base,
+                "current": value,
+                "change": change,
+                "regression": -sign * change > threshold,
+            })
+    return rows
+
+
+def print_report(rows: List[Dict]):
+    """Печатает таблицу сравнения."""
+    print(f"{'Бенчмарк':<32} {'Метрика':<22} {'База':>12} {'Сейчас':>12} {'Изм.':>9}")
+    for row in rows:
+        mark = '  [!] РЕГРЕССИЯ' if row['regression'] else ''
+        print(f"{row['benchmark']:<32} {row['metric']:<22} {row['baseline']:>12} "
+              f"{row['current']:>12} {row['change']:>+9.1%}{mark}")
+    regressions = sum(row['regression'] for row in rows)
+    print(f"\nРегрессий: {regressions} из {len(rows)} метрик")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение результатов бенчмарков с базовыми")
+    parser.add_argument('baseline', help="JSON с базовыми результатами")
+    parser.add_argument('current', help="JSON с текущими результатами")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Допустимое ухудшение (доля, по умолчанию 0.15 = 15%%)")
+    args = parser.parse_args()
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, 'r', encoding='utf-8') as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, args.threshold)
+    print_report(rows)
+    sys.exit(1 if any(row['regression'] for row in rows) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+import math
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import requests
+
+# Операция нагрузки: функция (session, base_url, rnd) -> requests.Response
+Operation = Callable[[requests.Session, str, random.Random], requests.Response]
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Перцентиль p (0..100) методом ближайшего ранга."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def summarize(latencies: List[float], errors: int, statuses: Dict[int, int], duration: float) -> Dict:
+    """Сводная статистика прогона: RPS, доля ошибок и перцентили задержки в мс."""
+    total = len(latencies)
+    ms = [x * 1000 for x in latencies]
+    return {
+        "requests": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "duration_s": round(duration, 3),
+        "rps": round(total / duration, 2) if duration else 0.0,
+        "mean_ms": round(sum(ms) / total, 3) if total else 0.0,
+        "p50_ms": round(percentile(ms, 50), 3),
+        "p90_ms": round(percentile(ms, 90), 3),
+        "p99_ms": round(percentile(ms, 99), 3),
+        "max_ms": round(max(ms), 3) if ms else 0.0,
+    }
+
+
+def parse_mix(spec: str, operations: Dict[str, Operation]) -> List[Tuple[str, int]]:
+    """Разбирает строку вида 'get=60,set=20,scan=20' в список (операция, вес)."""
+    mix = []
+    for part in spec.split(','):
+        name, _, weight = part.strip().partition('=')
+        if name not in operations:
+            raise ValueError(f"Неизвестная операция '{name}', доступны: {', '.join(operations)}")
+        try:
+            weight = int(weight or 1)
+        except ValueError:
+            raise ValueError(f"Вес операции '{name}' должен быть целым числом, получено '{weight}'")
+        if weight < 1:
+            raise ValueError(f"Вес операции '{name}' должен быть не меньше 1, получено {weight}")
+        mix.append((name, weight))
+    return mix
+
+
+def _run_once(base_url: str, operations: Dict[str, Operation], plan: List[str],
+              concurrency: int, seed: int) -> Dict:
+    """Выполняет запросы из plan в concurrency потоков и возвращает сводную статистику."""
+    local = threading.local()
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    errors = 0
+    stats_lock = threading.Lock()
+
+    def worker(i: int):
+        nonlocal errors
+        # Каждому потоку своя сессия (keep-alive) и свой генератор случайных чисел
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+            local.rnd = random.Random(seed + i)
+        started = time.perf_counter()
+        try:
+            status = operations[plan[i]](local.session, base_url, local.rnd).status_code
+        except requests.RequestException:
+            status = 0
+        elapsed = time.perf_counter() - started
+        with stats_lock:
+            latencies.append(elapsed)
+            statuses[status] = statuses.get(status, 0) + 1
+            if status == 0 or status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(len(plan))))
+    duration = time.perf_counter() - started
+    return summarize(latencies, errors, statuses, duration)
+
+
+# Счетчики, которые суммируются по прогонам (вместе со statuses)
+COUNTERS = ('requests', 'errors')
+
+
+def median_of(results: List[Dict]) -> Dict:
+    """
+    Объединяет несколько прогонов: счетчики запросов, ошибок и статусов суммируются,
+    error_rate пересчитывается по суммам, для остальных метрик берется нижняя медиана
+    (значение одного из прогонов, без усреднения).
+    """
+    merged = {}
+    for key, value in results[0].items():
+        if key == 'statuses':
+            total: Dict[str, int] = {}
+            for result in results:
+                for status, count in result[key].items():
+                    total[status] = total.get(status, 0) + count
+            merged[key] = dict(sorted(total.items()))
+        elif key in COUNTERS:
+            merged[key] = sum(result[key] for result in results)
+        elif isinstance(value, (int, float)):
+            merged[key] = statistics.median_low(result[key] for result in results)
+        else:
+            merged[key] = value
+    merged['error_rate'] = round(merged['errors'] / merged['requests'], 4) if merged['requests'] else 0.0
+    return merged
+
+
+def run_load(base_url: str, operations: Dict[str, Operation], mix: List[Tuple[str, int]],
+             total_requests: int, concurrency: int, runs: int = 3, warmup: int = 100,
+             seed: int = 0) -> Dict:
+    """
+    Выполняет runs прогонов по total_requests запросов в concurrency потоков
+    и возвращает метрики, объединенные по прогонам (см. median_of).
+    Перед замерами выполняется warmup запросов, результаты которых не учитываются.
+    Операции выбираются случайно пропорционально весам из mix.
+    Ответы со статусом >= 400 и сетевые ошибки считаются ошибками.
+    """
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    rnd = random.Random(seed)
+
+    if warmup:
+        _run_once(base_url, operations, rnd.choices(names, weights=weights, k=warmup), concurrency, seed)
+
+    results = []
+    for run in range(runs):
+        plan = rnd.choices(names, weights=weights, k=total_requests)
+        results.append(_run_once(base_url, operations, plan, concurrency, seed + (run + 1) * total_requests))
+
+    result = median_of(results)
+    result["runs"] = runs
+    result["warmup"] = warmup
+    result["concurrency"] = concurrency
+    result["mix"] = dict(mix)
+    return result
+
+
+# --- Управление локальными серверами ---
+
+def free_port() -> int:
+    """Возвращает свободный TCP-порт на localhost."""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(args: List[str], cwd: str) -> subprocess.Popen:
+    """Запускает сервер текущим интерпретатором без вывода в консоль."""
+    return subprocess.Popen([sys.executable] + args, cwd=cwd,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def stop_servers(procs: List[subprocess.Popen]):
+    """Останавливает запущенные серверы."""
+    for proc in procs:
+        proc.terminate()
+    for proc in procs:
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def wait_http(url: str, timeout: float = 20.0, expect: int = 200):
+    """Ждет, пока url не начнет отвечать ожидаемым статусом."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if requests.get(url, timeout=1).status_code == expect:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Сервер {url} не ответил за {timeout} с")
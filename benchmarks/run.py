@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+import bench_http
+import bench_pipeline
+from compare import compare, print_report
+from loadgen import parse_mix
+
+SUITES = ['lab7', 'lab6', 'lab8']
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def _sizes(value: str):
+    return [int(x) for x in value.split(',')]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки и нагрузочные тесты lab-6, lab-7, lab-8")
+    parser.add_argument('--suite', action='append', choices=SUITES,
+                        help="Набор для запуска (можно указать несколько раз, по умолчанию все)")
+    parser.add_argument('--requests', type=int, default=2000, help="Количество HTTP-запросов на прогон")
+    parser.add_argument('--concurrency', type=int, default=8, help="Количество параллельных клиентов")
+    parser.add_argument('--runs', type=int, default=3,
+                        help="Количество HTTP-прогонов, метрики объединяются по медиане (по умолчанию 3)")
+    parser.add_argument('--warmup', type=int, default=100,
+                        help="Количество прогревочных запросов перед замерами (по умолчанию 100)")
+    parser.add_argument('--lab7-mix', default=bench_http.LAB7_DEFAULT_MIX,
+                        help=f"Смесь запросов к lab-7 (по умолчанию {bench_http.LAB7_DEFAULT_MIX})")
+    parser.add_argument('--lab6-mix', default=bench_http.LAB6_DEFAULT_MIX, help="Смесь запросов к lab-6")
+    parser.add_argument('--instances', type=int, default=3, help="Количество инстансов lab-6/app.py")
+    parser.add_argument('--gen-sizes', type=_sizes, default=[1000, 10000],
+                        help="Размеры данных для generation.py через запятую")
+    parser.add_argument('--proc-sizes', type=_sizes, default=[1000, 10000, 100000],
+                        help="Размеры данных для processor.py через запятую")
+    parser.add_argument('--output', help="Файл результатов (по умолчанию results/<время>.json)")
+    parser.add_argument('--baseline', help="JSON с базовыми результатами для поиска регрессий")
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help="Допустимое ухудшение при сравнении (доля, по умолчанию 0.15)")
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error("--runs должен быть не меньше 1")
+    try:
+        lab7_mix = parse_mix(args.lab7_mix, bench_http.LAB7_OPERATIONS)
+        lab6_mix = parse_mix(args.lab6_mix, bench_http.LAB6_OPERATIONS)
+    except ValueError as e:
+        parser.error(str(e))
+
+    suites = args.suite or SUITES
+    benchmarks = {}
+
+    if 'lab7' in suites:
+        print("lab-7: нагрузка на API хранилища...")
+        benchmarks['lab7.api'] = bench_http.bench_lab7(
+            lab7_mix, args.requests, args.concurrency, args.runs, args.warmup)
+
+    if 'lab6' in suites:
+        print(f"lab-6: нагрузка на балансировщик ({args.instances} инстанса)...")
+        benchmarks[f'lab6.balancer.n{args.instances}'] = bench_http.bench_lab6(
+            args.instances, lab6_mix, args.requests, args.concurrency, args.runs, args.warmup)
+
+    if 'lab8' in suites:
+        for size in args.gen_sizes:
+            print(f"lab-8: generation.py, {size} транзакций...")
+            benchmarks[f'lab8.generation.n{size}'] = bench_pipeline.bench_generation(size)
+        for size in args.proc_sizes:
+            print(f"lab-8: processor.py, {size} транзакций...")
+            benchmarks[f'lab8.processor.n{size}'] = bench_pipeline.bench_processor(size)
+
+    results = {
+        "created": datetime.now().isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"requests": args.requests, "concurrency": args.concurrency,
+                   "runs": args.runs, "warmup": args.warmup},
+        "benchmarks": benchmarks,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, datetime.now().strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=4)
+    print(f"Результаты сохранены в {output}")
+
+    for name, metrics in benchmarks.items():
+        summary = ', '.join(f"{k}={v}" for k, v in metrics.items() if not isinstance(v, dict))
+        print(f" -> {name}: {summary}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print()
+        rows = compare(baseline, results, args.threshold)
+        print_report(rows)
+        if any(row['regression'] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 import json
 import os
+import threading
+from bisect import bisect_left, insort
 from flask import Flask, request, jsonify
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -8,8 +10,18 @@ app = Flask(__name__)
 
 # --- Конфигурация хранилища ---
 DATA_FILE = 'data.json'
+INDEX_FILE = 'data.index.json'
 data = {}
 
+# Упорядоченный индекс ключей (отсортированный список) для /scan и /count.
+# Поддерживается вместе со словарем data и сохраняется рядом со снапшотом.
+keys_index = []
+# Защищает согласованность data и keys_index между потоками сервера
+lock = threading.Lock()
+
+SCAN_DEFAULT_LIMIT = 100
+SCAN_MAX_LIMIT = 1000
+
 # --- Настройка Flask-Limiter ---
 # Раздел II.3.a: Общее ограничение 100 запросов в сутки для всех маршрутов
 limiter = Limiter(
@@ -35,15 +47,66 @@ def load_data():
     else:
         print("Файл данных не найден, создано новое хранилище.")
         data = {}
+    load_index()
+
+def load_index():
+    """Загружает сохраненный индекс ключей; при расхождении с data строит заново."""
+    global keys_index
+    if os.path.exists(INDEX_FILE):
+        try:
+            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            # Индекс валиден, если содержит ровно ключи data в отсортированном порядке
+            if (isinstance(saved, list)
+                    and len(saved) == len(data)
+                    and all(isinstance(k, str) for k in saved)
+                    and all(k in data for k in saved)
+                    and all(a < b for a, b in zip(saved, saved[1:]))):
+                keys_index = saved
+                print(f"Индекс загружен из {INDEX_FILE}")
+                return
+            print("Индекс не совпадает с данными, выполняется перестроение.")
+        except (ValueError, OSError):
+            # Индекс производный от data, любая ошибка чтения - повод перестроить
+            print("Ошибка чтения индекса, выполняется перестроение.")
+    keys_index = sorted(data)
 
 def save_data():
-    """Сохраняет текущее состояние словаря в файл."""
+    """Сохраняет текущее состояние словаря и индекса ключей в файлы."""
     try:
         with open(DATA_FILE, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
+        with open(INDEX_FILE, 'w', encoding='utf-8') as f:
+            json.dump(keys_index, f, ensure_ascii=False)
     except Exception as e:
         print(f"Ошибка при сохранении: {e}")
 
+# --- Функции для работы с индексом ключей ---
+
+def index_add(key):
+    """Добавляет ключ в индекс, если его там еще нет."""
+    pos = bisect_left(keys_index, key)
+    if pos == len(keys_index) or keys_index[pos] != key:
+        insort(keys_index, key, lo=pos)
+
+def index_remove(key):
+    """Удаляет ключ из индекса."""
+    pos = bisect_left(keys_index, key)
+    if pos < len(keys_index) and keys_index[pos] == key:
+        del keys_index[pos]
+
+def prefix_bounds(prefix):
+    """Возвращает границы [lo, hi) в индексе для ключей с заданным префиксом."""
+    lo = bisect_left(keys_index, prefix)
+    # Верхняя граница: префикс с увеличенным последним символом
+    end = prefix
+    while end and ord(end[-1]) == 0x10FFFF:
+        end = end[:-1]
+    if not end:
+        return lo, len(keys_index)
+    end = end[:-1] + chr(ord(end[-1]) + 1)
+    return lo, bisect_left(keys_index, end, lo)
+
 # --- API Маршруты (Раздел II.2) ---
 
 @app.route('/set', methods=['POST'])
@@ -61,8 +124,14 @@ def set_value():
     key = req_data['key']
     value = req_data['value']
     
-    data[key] = value
-    save_data() # Сохраняем сразу после изменения
+    # Ключи JSON-снапшота и индекса всегда строки
+    if not isinstance(key, str):
+        return jsonify({"error": "Ключ 'key' должен быть строкой"}), 400
+    
+    with lock:
+        data[key] = value
+        index_add(key)
+        save_data() # Сохраняем сразу после изменения
     
     return jsonify({"message": "Ключ сохранен", "key": key, "value": value}), 200
 
@@ -77,10 +146,12 @@ def get_value(key):
 @limiter.limit("10 per minute") # Раздел II.3.b: Лимит для delete
 def delete_value(key):
     """Удалить ключ."""
-    if key in data:
-        del data[key]
-        save_data() # Сохраняем сразу после изменения
-        return jsonify({"message": f"Ключ '{key}' удален"}), 200
+    with lock:
+        if key in data:
+            del data[key]
+            index_remove(key)
+            save_data() # Сохраняем сразу после изменения
+            return jsonify({"message": f"Ключ '{key}' удален"}), 200
     return jsonify({"error": "Ключ не найден"}), 404
 
 @app.route('/exists/<key>', methods=['GET'])
@@ -89,6 +160,40 @@ def exists_key(key):
     exists = key in data
     return jsonify({"key": key, "exists": exists}), 200
 
+@app.route('/scan', methods=['GET'])
+def scan_keys():
+    """
+    Постраничный обход ключей по префиксу в отсортированном порядке.
+    Параметры: prefix, start (курсор - ключ, с которого продолжить), limit.
+    В ответе поле "next" содержит курсор следующей страницы или null.
+    """
+    prefix = request.args.get('prefix', '')
+    start = request.args.get('start')
+    try:
+        limit = int(request.args.get('limit', SCAN_DEFAULT_LIMIT))
+    except ValueError:
+        return jsonify({"error": "Параметр 'limit' должен быть целым числом"}), 400
+    if not 1 <= limit <= SCAN_MAX_LIMIT:
+        return jsonify({"error": f"Параметр 'limit' должен быть от 1 до {SCAN_MAX_LIMIT}"}), 400
+
+    with lock:
+        lo, hi = prefix_bounds(prefix)
+        if start is not None:
+            lo = max(lo, bisect_left(keys_index, start, lo, hi))
+
+        page = keys_index[lo:min(lo + limit, hi)]
+        next_cursor = keys_index[lo + limit] if lo + limit < hi else None
+        items = [{"key": k, "value": data[k]} for k in page]
+    return jsonify({"prefix": prefix, "items": items, "next": next_cursor}), 200
+
+@app.route('/count', methods=['GET'])
+def count_keys():
+    """Подсчитать количество ключей с заданным префиксом."""
+    prefix = request.args.get('prefix', '')
+    with lock:
+        lo, hi = prefix_bounds(prefix)
+    return jsonify({"prefix": prefix, "count": hi - lo}), 200
+
 # --- Обработчик ошибок лимитов ---
 @app.errorhandler(429)
 def ratelimit_handler(e):
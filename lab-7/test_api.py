@@ -26,4 +26,17 @@ for i in range(12):
         print(f"Запрос {i+1}: ОШИБКА 429 (Too Many Requests) - Лимитер работает!")
         break
     else:
-        print(f"Запрос {i+1}: OK")
\ No newline at end of file
+        print(f"Запрос {i+1}: OK")
+
+# Ключи test* уже сохранены на шаге 5, новые set не нужны (лимит исчерпан)
+print("\n6. Сканируем ключи по префиксу постранично (GET /scan)...")
+resp = requests.get(f"{BASE_URL}/scan", params={"prefix": "test", "limit": 5})
+page = resp.json()
+print(page)
+if resp.status_code == 200 and page["next"]:
+    resp = requests.get(f"{BASE_URL}/scan", params={"prefix": "test", "start": page["next"], "limit": 5})
+    print(resp.json())
+
+print("\n7. Считаем ключи по префиксу (GET /count)...")
+resp = requests.get(f"{BASE_URL}/count", params={"prefix": "test"})
+print(resp.json())
\ No newline at end of file